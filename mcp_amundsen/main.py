@@ -1,9 +1,17 @@
+import functools
 import os
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
+from mcp.types import TextContent
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; FastMCP serializes dicts itself
+    orjson = None
 
 from mcp_amundsen.clients import SearchApiClient, TableApiClient
+from mcp_amundsen.errors import AmundsenError
 from mcp_amundsen.processors import MetadataProcessor, SearchProcessor
 
 # Initialize MCP server
@@ -18,8 +26,41 @@ metadata_processor = MetadataProcessor()
 search_processor = SearchProcessor()
 
 
+def _amundsen_errors(func):
+    """Maps client exceptions onto the tools' {"error": ...} response shape.
+
+    The clients raise AmundsenError subclasses on failure; processors run
+    only on successful payloads, so the happy path carries no error probing.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return await func(*args, **kwargs)
+        except AmundsenError as e:
+            return {"error": str(e)}
+
+    return wrapper
+
+
+def _as_json_content(data: Any) -> Any:
+    """Pre-serializes a large payload once with orjson.
+
+    FastMCP passes TextContent results through to the wire untouched, so
+    handing it pre-encoded JSON skips FastMCP's own (slower) serialization
+    of the parsed dict. Without orjson the dict is returned unchanged and
+    FastMCP serializes it as usual. Tools returning this must be registered
+    with structured_output=False, otherwise FastMCP would also wrap the
+    TextContent envelope itself into structuredContent.result.
+    """
+    if orjson is None:
+        return data
+    return TextContent(type="text", text=orjson.dumps(data).decode())
+
+
 @mcp.tool()
-def get_table_columns(database: str, schema_name: str, table_name: str) -> dict[str, Any]:
+@_amundsen_errors
+async def get_table_columns(database: str, schema_name: str, table_name: str) -> dict[str, Any]:
     """
     Fetches table columns for a specific table and extracts simplified information.
 
@@ -28,12 +69,38 @@ def get_table_columns(database: str, schema_name: str, table_name: str) -> dict[
     :param table_name: The name of the table.
     :return: A dictionary containing simplified column information.
     """
-    table_data = table_client.get_metadata(database, schema_name, table_name)
+    table_data = await table_client.get_metadata(database, schema_name, table_name, fields=("columns",))
     return metadata_processor.extract_columns(table_data)
 
 
 @mcp.tool()
-def get_table_date_range(database: str, schema_name: str, table_name: str) -> dict[str, Any]:
+@_amundsen_errors
+async def get_tables_bulk(tables: list[dict[str, str]]) -> list[dict[str, Any]] | dict[str, Any]:
+    """
+    Fetches column metadata for several tables concurrently.
+
+    :param tables: A list of dicts, each with "database", "schema_name" and "table_name" keys.
+    :return: One entry per requested table, in order. A failed lookup carries
+             an "error" key instead of failing the whole batch.
+    """
+
+    specs = [(spec.get("database"), spec.get("schema_name"), spec.get("table_name")) for spec in tables]
+    results = await table_client.get_metadata_bulk(specs, fields=("columns",))
+
+    response = []
+    for spec, result in zip(tables, results):
+        entry = dict(spec)
+        if isinstance(result, BaseException):
+            entry["error"] = str(result)
+        else:
+            entry.update(metadata_processor.extract_columns(result))
+        response.append(entry)
+    return response
+
+
+@mcp.tool()
+@_amundsen_errors
+async def get_table_date_range(database: str, schema_name: str, table_name: str) -> dict[str, Any]:
     """
     Fetches the available date range for a specific table.
 
@@ -42,12 +109,13 @@ def get_table_date_range(database: str, schema_name: str, table_name: str) -> di
     :param table_name: The name of the table.
     :return: A dictionary containing the date range.
     """
-    table_data = table_client.get_metadata(database, schema_name, table_name)
+    table_data = await table_client.get_metadata(database, schema_name, table_name, fields=("watermarks",))
     return metadata_processor.extract_date_range(table_data)
 
 
 @mcp.tool()
-def get_table_code_url(database: str, schema_name: str, table_name: str) -> str:
+@_amundsen_errors
+async def get_table_code_url(database: str, schema_name: str, table_name: str) -> str | dict[str, Any]:
     """
     Fetches the source code URL for the pipeline that generates this table.
 
@@ -56,12 +124,13 @@ def get_table_code_url(database: str, schema_name: str, table_name: str) -> str:
     :param table_name: The name of the table.
     :return: url of code that generate the table
     """
-    table_data = table_client.get_metadata(database, schema_name, table_name)
+    table_data = await table_client.get_metadata(database, schema_name, table_name, fields=("source",))
     return metadata_processor.extract_code_location(table_data)
 
 
 @mcp.tool()
-def get_table_airflow_url(database: str, schema_name: str, table_name: str) -> str:
+@_amundsen_errors
+async def get_table_airflow_url(database: str, schema_name: str, table_name: str) -> str | dict[str, Any]:
     """
     Fetches the airflow url of a specific table.
 
@@ -70,12 +139,13 @@ def get_table_airflow_url(database: str, schema_name: str, table_name: str) -> s
     :param table_name: The name of the table.
     :return: url of airflow that generate the table
     """
-    table_data = table_client.get_metadata(database, schema_name, table_name)
+    table_data = await table_client.get_metadata(database, schema_name, table_name, fields=("table_writer",))
     return metadata_processor.extract_airflow_url(table_data)
 
 
 @mcp.tool()
-def get_table_schedule(database: str, schema_name: str, table_name: str) -> str:
+@_amundsen_errors
+async def get_table_schedule(database: str, schema_name: str, table_name: str) -> str | dict[str, Any]:
     """
     Fetches the schedule update of a specific table.
 
@@ -84,13 +154,16 @@ def get_table_schedule(database: str, schema_name: str, table_name: str) -> str:
     :param table_name: The name of the table.
     :return: Schedule of the table update
     """
-    table_data = table_client.get_metadata(database, schema_name, table_name)
+    table_data = await table_client.get_metadata(
+        database, schema_name, table_name, fields=("programmatic_descriptions", "schema", "name")
+    )
     parsed_programmatic_descriptions = metadata_processor.parse_programmatic_descriptions(table_data)
     return metadata_processor.extract_table_schedule(parsed_programmatic_descriptions)
 
 
 @mcp.tool()
-def get_table_storage_location(database: str, schema_name: str, table_name: str) -> str:
+@_amundsen_errors
+async def get_table_storage_location(database: str, schema_name: str, table_name: str) -> str | dict[str, Any]:
     """
     Fetches the storage location update of a specific table.
 
@@ -99,13 +172,16 @@ def get_table_storage_location(database: str, schema_name: str, table_name: str)
     :param table_name: The name of the table.
     :return: storage location of the table update
     """
-    table_data = table_client.get_metadata(database, schema_name, table_name)
+    table_data = await table_client.get_metadata(
+        database, schema_name, table_name, fields=("programmatic_descriptions", "schema", "name")
+    )
     parsed_programmatic_descriptions = metadata_processor.parse_programmatic_descriptions(table_data)
     return metadata_processor.extract_table_storage_location(parsed_programmatic_descriptions)
 
 
 @mcp.tool()
-def get_table_owners(database: str, schema_name: str, table_name: str) -> list[str] | dict[str, Any]:
+@_amundsen_errors
+async def get_table_owners(database: str, schema_name: str, table_name: str) -> list[str] | dict[str, Any]:
     """
     Fetches the owners of a specific table.
 
@@ -114,18 +190,19 @@ def get_table_owners(database: str, schema_name: str, table_name: str) -> list[s
     :param table_name: The name of the table.
     :return: A list containing the table owners.
     """
-    table_data = table_client.get_metadata(database, schema_name, table_name)
+    table_data = await table_client.get_metadata(database, schema_name, table_name, fields=("owners",))
     return metadata_processor.extract_owners(table_data)
 
 
-@mcp.tool()
-def get_table_lineage_info(
+@mcp.tool(structured_output=False)
+@_amundsen_errors
+async def get_table_lineage_info(
     database: str,
     schema_name: str,
     table_name: str,
     depth: int = 10,
     direction: str = "both",
-) -> dict[str, Any]:
+) -> Any:
     """
     Fetches lineage information for a specific table.
 
@@ -136,11 +213,13 @@ def get_table_lineage_info(
     :param direction: The direction of the lineage to fetch (upstream, downstream, or both).
     :return: A dictionary containing the lineage information.
     """
-    return table_client.get_lineage(database, schema_name, table_name, depth, direction)
+    lineage = await table_client.get_lineage(database, schema_name, table_name, depth, direction)
+    return _as_json_content(lineage)
 
 
 @mcp.tool()
-def get_table_dashboard_info(database: str, schema_name: str, table_name: str) -> list[dict[str, Any]] | dict[str, Any]:
+@_amundsen_errors
+async def get_table_dashboard_info(database: str, schema_name: str, table_name: str) -> list[dict[str, Any]] | dict[str, Any]:
     """
     Fetches dashboards created from a specific table.
 
@@ -149,12 +228,13 @@ def get_table_dashboard_info(database: str, schema_name: str, table_name: str) -
     :param table_name: The name of the table.
     :return: A list of dictionaries containing dashboard information.
     """
-    dashboard_data = table_client.get_dashboards(database, schema_name, table_name)
+    dashboard_data = await table_client.get_dashboards(database, schema_name, table_name)
     return metadata_processor.extract_dashboards(dashboard_data)
 
 
 @mcp.tool()
-def get_table_dashboard_questions(
+@_amundsen_errors
+async def get_table_dashboard_questions(
     database: str, schema: str, table: str, dashboard_name: str, limit: int = 10
 ) -> list[dict[str, Any]] | dict[str, Any]:
     """
@@ -166,7 +246,7 @@ def get_table_dashboard_questions(
     :param dashboard_name: The name of the dashboard.
     :return: A list of questions struct
     """
-    questions = table_client.questions(database, schema, table, dashboard_name, limit)
+    questions = await table_client.questions(database, schema, table, dashboard_name, limit)
     response = []
     for question in questions:
         data = {"name": question["name"], "url": question["url"]}
@@ -176,7 +256,8 @@ def get_table_dashboard_questions(
 
 
 @mcp.tool()
-def get_table_dashboard_question_query(
+@_amundsen_errors
+async def get_table_dashboard_question_query(
     database: str, schema: str, table: str, dashboard_name: str, question_name: str
 ) -> dict[str, Any]:
     """
@@ -189,13 +270,14 @@ def get_table_dashboard_question_query(
     :param question_name: The name of the question.
     :return: query text of specific question
     """
-    question = table_client.question_detail(database, schema, table, dashboard_name, question_name)
+    question = await table_client.question_detail(database, schema, table, dashboard_name, question_name)
 
     return {"result": {"query": question.get("query_text", "")}}
 
 
 @mcp.tool()
-def search_tables(
+@_amundsen_errors
+async def search_tables(
     query_term: str,
     schemas: list[str] = [],
     tables: list[str] = [],
@@ -216,7 +298,7 @@ def search_tables(
     :param tags: A list of tags to filter by.
     :return: A dictionary containing the search results.
     """
-    search_result = search_client.get_search_data(
+    search_result = await search_client.get_search_data(
         query_term,
         ["hive"],
         schemas,
@@ -1,44 +1,49 @@
 import re
 from typing import Any
 
+# Response key -> raw payload key for a dashboard entry. dict.get keeps a
+# row with a missing key as None instead of failing the whole response.
+_DASHBOARD_FIELDS = (("url", "url"), ("dashboard_name", "name"), ("collection_name", "group_name"))
+
 
 class MetadataProcessor:
     @staticmethod
     def extract_columns(
         table_data: dict[str, Any],
     ) -> dict[str, Any]:
-        if "error" in table_data:
-            return {"error": table_data["error"]}
-
         column_metadata = {"columns": [], "partition_keys": []}
 
-        for column in table_data.get("columns", []):
+        # Local aliases and tuple defaults keep the per-column work down to a
+        # handful of dict lookups; wide tables can have hundreds of columns.
+        cols_out = column_metadata["columns"]
+        parts_out = column_metadata["partition_keys"]
+
+        for column in table_data.get("columns", ()):
+            get = column.get
             column_info = {
-                "name": column.get("name"),
-                "type": column.get("col_type"),
-                "description": column.get("description"),
+                "name": get("name"),
+                "type": get("col_type"),
+                "description": get("description"),
             }
 
-            column_metadata["columns"].append(column_info)
+            cols_out.append(column_info)
 
-            for badge in column.get("badges", []):
-                if badge.get("badge_name") == "partition column":
-                    column_metadata["partition_keys"].append(column_info)
+            # "or ()" also covers an explicit "badges": null in the payload.
+            if any(badge.get("badge_name") == "partition column" for badge in get("badges") or ()):
+                parts_out.append(column_info)
 
         return column_metadata
 
     @staticmethod
     def extract_date_range(table_data: dict[str, Any]) -> dict[str, Any]:
-        if "error" in table_data:
-            return {"error": table_data["error"]}
-
         date_range = {"from": None, "to": None}
 
-        for watermark in table_data.get("watermarks", []):
-            watermark_type = watermark.get("watermark_type")
+        for watermark in table_data.get("watermarks", ()):
+            get = watermark.get
+            watermark_type = get("watermark_type")
             range_value = {
-                "key": watermark.get("partition_key"),
-                "value": watermark.get("partition_value"),
+                "key": get("partition_key"),
+                "value": get("partition_value"),
             }
 
             if watermark_type == "low_watermark":
@@ -51,40 +56,16 @@ class MetadataProcessor:
 
     @staticmethod
     def extract_owners(table_data: dict[str, Any]) -> list[str] | dict[str, Any]:
-        if "error" in table_data:
-            return {"error": table_data["error"]}
-
-        owners = []
-
-        for owner in table_data.get("owners", []):
-            user_id = owner.get("user_id")
-            owners.append(user_id)
-
-        return owners
+        return [owner.get("user_id") for owner in table_data.get("owners", ())]
 
     @staticmethod
     def extract_dashboards(
         dashboard_data: dict[str, Any],
     ) -> list[dict[str, Any]] | dict[str, Any]:
-        if "error" in dashboard_data:
-            return {"error": dashboard_data["error"]}
-
-        raw_dashboards = dashboard_data.get("dashboards", [])
-        dashboards = []
-
-        for raw_dashboard in raw_dashboards:
-            dashboard_url = raw_dashboard.get("url")
-            dashboard_name = raw_dashboard.get("name")
-            collection_name = raw_dashboard.get("group_name")
-            dashboards.append(
-                {
-                    "url": dashboard_url,
-                    "dashboard_name": dashboard_name,
-                    "collection_name": collection_name,
-                }
-            )
-
-        return dashboards
+        return [
+            {key: raw_dashboard.get(source) for key, source in _DASHBOARD_FIELDS}
+            for raw_dashboard in dashboard_data.get("dashboards") or ()
+        ]
 
     @staticmethod
     def extract_code_location(table_data: dict[str, Any]) -> str:
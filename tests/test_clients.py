@@ -0,0 +1,243 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from mcp_amundsen import clients
+from mcp_amundsen.clients import TableApiClient
+from mcp_amundsen.errors import AmundsenApiError, TableNotFoundError
+
+pytestmark = pytest.mark.anyio
+
+MOCK_METADATA = {"name": "table1", "columns": []}
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+class _FakeStream:
+    """Stands in for _client.stream, replaying the body in fixed chunks."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    def __call__(self, method, url):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def aiter_bytes(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+@patch.object(TableApiClient, "make_request", new_callable=AsyncMock)
+async def test_get_metadata_is_cached(mock_make_request, monkeypatch):
+    monkeypatch.setenv("AMUNDSEN_META_TTL", "60")
+    mock_make_request.return_value = MOCK_METADATA
+    client = TableApiClient()
+    first = await client.get_metadata("db", "schema", "table")
+    second = await client.get_metadata("db", "schema", "table")
+    mock_make_request.assert_called_once()
+    assert first == MOCK_METADATA
+    assert second == MOCK_METADATA
+
+
+@patch.object(TableApiClient, "make_request", new_callable=AsyncMock)
+async def test_get_metadata_cache_disabled(mock_make_request, monkeypatch):
+    monkeypatch.setenv("AMUNDSEN_META_TTL", "0")
+    mock_make_request.return_value = MOCK_METADATA
+    client = TableApiClient()
+    await client.get_metadata("db", "schema", "table")
+    await client.get_metadata("db", "schema", "table")
+    assert mock_make_request.call_count == 2
+
+
+@patch.object(TableApiClient, "make_request", new_callable=AsyncMock)
+async def test_get_metadata_error_not_cached(mock_make_request, monkeypatch):
+    monkeypatch.setenv("AMUNDSEN_META_TTL", "60")
+    mock_make_request.side_effect = [AmundsenApiError("boom"), MOCK_METADATA]
+    client = TableApiClient()
+    with pytest.raises(AmundsenApiError):
+        await client.get_metadata("db", "schema", "table")
+    assert await client.get_metadata("db", "schema", "table") == MOCK_METADATA
+    assert mock_make_request.call_count == 2
+
+
+@patch.object(TableApiClient, "make_request", new_callable=AsyncMock)
+async def test_get_metadata_stale_hit_refreshes_in_background(mock_make_request, monkeypatch):
+    monkeypatch.setenv("AMUNDSEN_META_TTL", "60")
+    mock_make_request.side_effect = [{"v": 1}, {"v": 2}]
+    client = TableApiClient()
+    assert await client.get_metadata("db", "schema", "table") == {"v": 1}
+
+    # Age the entry past the TTL but inside the stale window.
+    key = ("db", "schema", "table", None)
+    future, cached_at = client._metadata_cache._entries[key]
+    client._metadata_cache._entries[key] = (future, cached_at - 61)
+
+    assert await client.get_metadata("db", "schema", "table") == {"v": 1}
+    for _ in range(5):  # let the background refresh task run
+        await asyncio.sleep(0)
+    assert await client.get_metadata("db", "schema", "table") == {"v": 2}
+    assert mock_make_request.call_count == 2
+
+
+@patch.object(TableApiClient, "make_request", new_callable=AsyncMock)
+async def test_get_metadata_bulk_returns_failures_in_place(mock_make_request, monkeypatch):
+    monkeypatch.setenv("AMUNDSEN_META_TTL", "0")
+    mock_make_request.side_effect = [MOCK_METADATA, AmundsenApiError("boom")]
+    client = TableApiClient()
+    results = await client.get_metadata_bulk([("db", "schema", "table1"), ("db", "schema", "table2")])
+    assert results[0] == MOCK_METADATA
+    assert isinstance(results[1], AmundsenApiError)
+
+
+class _StubRustyReq:
+    """Stands in for the optional rusty_req module, recording the batch."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = None
+
+    async def fetch_requests(self, requests, mode, total_timeout):
+        self.requests = requests
+        return self.responses
+
+
+async def test_get_metadata_bulk_rusty_req(monkeypatch):
+    stub = _StubRustyReq(
+        [
+            {"tag": "0", "body": '{"name": "table1"}'},
+            {"tag": "1", "error": "connect timeout"},
+            {"tag": "-1", "body": "{}"},  # out-of-range tags must not touch other slots
+            {"tag": "99", "body": "{}"},
+            {"tag": "bogus", "body": "{}"},
+        ]
+    )
+    monkeypatch.setattr(clients, "rusty_req", stub)
+    client = TableApiClient()
+    specs = [("db", "schema", "table1"), ("db", "schema", "table2"), ("db", "schema", "table3")]
+    results = await client.get_metadata_bulk(specs)
+    assert [request["tag"] for request in stub.requests] == ["0", "1", "2"]
+    assert results[0] == {"name": "table1"}
+    assert isinstance(results[1], AmundsenApiError)
+    assert "connect timeout" in str(results[1])
+    # table3 never got a response; it keeps the placeholder error.
+    assert isinstance(results[2], AmundsenApiError)
+
+
+async def test_get_metadata_bulk_rusty_req_undecodable_body(monkeypatch):
+    stub = _StubRustyReq([{"tag": "0", "body": "not json"}])
+    monkeypatch.setattr(clients, "rusty_req", stub)
+    client = TableApiClient()
+    results = await client.get_metadata_bulk([("db", "schema", "table1")])
+    assert isinstance(results[0], AmundsenApiError)
+
+
+@patch.object(TableApiClient, "make_request", new_callable=AsyncMock)
+async def test_get_metadata_field_projection(mock_make_request, monkeypatch):
+    monkeypatch.setenv("AMUNDSEN_META_TTL", "0")
+    monkeypatch.setenv("AMUNDSEN_FIELD_PROJECTION", "1")
+    mock_make_request.return_value = MOCK_METADATA
+    client = TableApiClient()
+    await client.get_metadata("db", "schema", "table", fields=("columns", "watermarks"))
+    requested_url = mock_make_request.call_args[0][0]
+    assert requested_url.endswith("?fields=columns,watermarks")
+
+
+@patch.object(TableApiClient, "make_request", new_callable=AsyncMock)
+async def test_get_metadata_field_projection_off_by_default(mock_make_request, monkeypatch):
+    monkeypatch.setenv("AMUNDSEN_META_TTL", "0")
+    monkeypatch.delenv("AMUNDSEN_FIELD_PROJECTION", raising=False)
+    mock_make_request.return_value = MOCK_METADATA
+    client = TableApiClient()
+    await client.get_metadata("db", "schema", "table", fields=("columns",))
+    requested_url = mock_make_request.call_args[0][0]
+    assert "fields=" not in requested_url
+
+
+# ijson bypasses make_request in favour of _client.stream, so force the
+# full-body fallback here; the streaming path has its own tests below.
+@patch("mcp_amundsen.clients.ijson", None)
+@patch.object(TableApiClient, "make_request", new_callable=AsyncMock)
+async def test_get_lineage_projects_entity_lists(mock_make_request):
+    mock_make_request.return_value = {
+        "upstream_entities": [{"key": "up"}],
+        "downstream_entities": [{"key": "down"}],
+        "depth": 1,
+        "direction": "both",
+    }
+    client = TableApiClient()
+    result = await client.get_lineage("db", "schema", "table")
+    assert result == {
+        "upstream_entities": [{"key": "up"}],
+        "downstream_entities": [{"key": "down"}],
+    }
+
+
+@pytest.mark.skipif(clients.ijson is None, reason="requires the ijson perf extra")
+async def test_get_lineage_streams_chunked_body(monkeypatch):
+    monkeypatch.setenv("AMUNDSEN_LINEAGE_TTL", "0")
+    body = json.dumps(
+        {
+            "upstream_entities": [{"key": "up"}],
+            "downstream_entities": [{"key": "down"}],
+            "depth": 1,
+            "direction": "both",
+        }
+    ).encode()
+    # Tiny chunks so the parse spans many reads, including ijson's read(0) probe.
+    chunks = [body[i : i + 7] for i in range(0, len(body), 7)]
+    monkeypatch.setattr(clients._client, "stream", _FakeStream(chunks))
+    client = TableApiClient()
+    result = await client.get_lineage("db", "schema", "table")
+    assert result == {
+        "upstream_entities": [{"key": "up"}],
+        "downstream_entities": [{"key": "down"}],
+    }
+
+
+@pytest.mark.skipif(clients.ijson is None, reason="requires the ijson perf extra")
+async def test_get_lineage_streaming_malformed_body(monkeypatch):
+    monkeypatch.setenv("AMUNDSEN_LINEAGE_TTL", "0")
+    monkeypatch.setattr(clients._client, "stream", _FakeStream([b'{"upstream_entities": [']))
+    client = TableApiClient()
+    with pytest.raises(AmundsenApiError):
+        await client.get_lineage("db", "schema", "table")
+
+
+@pytest.mark.skipif(clients.ijson is None, reason="requires the ijson perf extra")
+async def test_get_dashboards_streams_chunked_body(monkeypatch):
+    monkeypatch.setenv("AMUNDSEN_DASHBOARD_TTL", "0")
+    body = json.dumps({"dashboards": [{"name": "dash", "url": "http://d", "group_name": "g"}]}).encode()
+    chunks = [body[i : i + 7] for i in range(0, len(body), 7)]
+    monkeypatch.setattr(clients._client, "stream", _FakeStream(chunks))
+    client = TableApiClient()
+    result = await client.get_dashboards("db", "schema", "table")
+    assert result == {"dashboards": [{"name": "dash", "url": "http://d", "group_name": "g"}]}
+
+
+async def test_get_lineage_invalid_direction():
+    client = TableApiClient()
+    with pytest.raises(ValueError):
+        await client.get_lineage("db", "schema", "table", direction="sideways")
+
+
+@patch.object(TableApiClient, "make_request", new_callable=AsyncMock)
+async def test_get_metadata_not_found(mock_make_request, monkeypatch):
+    monkeypatch.setenv("AMUNDSEN_META_TTL", "0")
+    mock_make_request.side_effect = AmundsenApiError("missing", status_code=404)
+    client = TableApiClient()
+    with pytest.raises(TableNotFoundError):
+        await client.get_metadata("db", "schema", "table")
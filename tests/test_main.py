@@ -1,7 +1,9 @@
-from unittest.mock import MagicMock, patch
+import json
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from mcp_amundsen.errors import AmundsenApiError
 from mcp_amundsen.main import (
     get_table_airflow_url,
     get_table_code_url,
@@ -14,9 +16,14 @@ from mcp_amundsen.main import (
     get_table_owners,
     get_table_schedule,
     get_table_storage_location,
+    get_tables_bulk,
+    mcp,
+    orjson,
     search_tables,
 )
 
+pytestmark = pytest.mark.anyio
+
 # Sample data for mocking
 MOCK_TABLE_DATA = {"description": "A sample table."}
 MOCK_PARSED_DESCRIPTIONS = {"schedule": "daily"}
@@ -26,128 +33,196 @@ MOCK_QUESTIONS_DATA = [{"name": "Question 1", "url": "http://local.test"}]
 MOCK_QUESTION_DETAIL = {"query_text": "SELECT * FROM table"}
 
 
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
 @patch("mcp_amundsen.main.metadata_processor")
-@patch("mcp_amundsen.main.table_client")
-def test_get_table_columns(mock_table_client, mock_metadata_processor):
+@patch("mcp_amundsen.main.table_client", new_callable=AsyncMock)
+async def test_get_table_columns(mock_table_client, mock_metadata_processor):
     mock_table_client.get_metadata.return_value = MOCK_TABLE_DATA
     mock_metadata_processor.extract_columns.return_value = {"columns": ["col1"]}
-    result = get_table_columns("db", "schema", "table")
-    mock_table_client.get_metadata.assert_called_once_with("db", "schema", "table")
+    result = await get_table_columns("db", "schema", "table")
+    mock_table_client.get_metadata.assert_called_once_with("db", "schema", "table", fields=("columns",))
     mock_metadata_processor.extract_columns.assert_called_once_with(MOCK_TABLE_DATA)
     assert result == {"columns": ["col1"]}
 
 
 @patch("mcp_amundsen.main.metadata_processor")
-@patch("mcp_amundsen.main.table_client")
-def test_get_table_date_range(mock_table_client, mock_metadata_processor):
+@patch("mcp_amundsen.main.table_client", new_callable=AsyncMock)
+async def test_get_table_date_range(mock_table_client, mock_metadata_processor):
     mock_table_client.get_metadata.return_value = MOCK_TABLE_DATA
     mock_metadata_processor.extract_date_range.return_value = {"start": "2023-01-01"}
-    result = get_table_date_range("db", "schema", "table")
-    mock_table_client.get_metadata.assert_called_once_with("db", "schema", "table")
+    result = await get_table_date_range("db", "schema", "table")
+    mock_table_client.get_metadata.assert_called_once_with("db", "schema", "table", fields=("watermarks",))
     mock_metadata_processor.extract_date_range.assert_called_once_with(MOCK_TABLE_DATA)
     assert result == {"start": "2023-01-01"}
 
 
 @patch("mcp_amundsen.main.metadata_processor")
-@patch("mcp_amundsen.main.table_client")
-def test_get_table_code_url(mock_table_client, mock_metadata_processor):
+@patch("mcp_amundsen.main.table_client", new_callable=AsyncMock)
+async def test_get_table_code_url(mock_table_client, mock_metadata_processor):
     mock_table_client.get_metadata.return_value = MOCK_TABLE_DATA
     mock_metadata_processor.extract_code_location.return_value = "http://code.url"
-    result = get_table_code_url("db", "schema", "table")
-    mock_table_client.get_metadata.assert_called_once_with("db", "schema", "table")
+    result = await get_table_code_url("db", "schema", "table")
+    mock_table_client.get_metadata.assert_called_once_with("db", "schema", "table", fields=("source",))
     mock_metadata_processor.extract_code_location.assert_called_once_with(MOCK_TABLE_DATA)
     assert result == "http://code.url"
 
 
 @patch("mcp_amundsen.main.metadata_processor")
-@patch("mcp_amundsen.main.table_client")
-def test_get_table_airflow_url(mock_table_client, mock_metadata_processor):
+@patch("mcp_amundsen.main.table_client", new_callable=AsyncMock)
+async def test_get_table_airflow_url(mock_table_client, mock_metadata_processor):
     mock_table_client.get_metadata.return_value = MOCK_TABLE_DATA
     mock_metadata_processor.extract_airflow_url.return_value = "http://airflow.url"
-    result = get_table_airflow_url("db", "schema", "table")
-    mock_table_client.get_metadata.assert_called_once_with("db", "schema", "table")
+    result = await get_table_airflow_url("db", "schema", "table")
+    mock_table_client.get_metadata.assert_called_once_with("db", "schema", "table", fields=("table_writer",))
     mock_metadata_processor.extract_airflow_url.assert_called_once_with(MOCK_TABLE_DATA)
     assert result == "http://airflow.url"
 
 
 @patch("mcp_amundsen.main.metadata_processor")
-@patch("mcp_amundsen.main.table_client")
-def test_get_table_schedule(mock_table_client, mock_metadata_processor):
+@patch("mcp_amundsen.main.table_client", new_callable=AsyncMock)
+async def test_get_table_schedule(mock_table_client, mock_metadata_processor):
     mock_table_client.get_metadata.return_value = MOCK_TABLE_DATA
     mock_metadata_processor.parse_programmatic_descriptions.return_value = MOCK_PARSED_DESCRIPTIONS
     mock_metadata_processor.extract_table_schedule.return_value = "daily"
-    result = get_table_schedule("db", "schema", "table")
-    mock_table_client.get_metadata.assert_called_once_with("db", "schema", "table")
+    result = await get_table_schedule("db", "schema", "table")
+    mock_table_client.get_metadata.assert_called_once_with(
+        "db", "schema", "table", fields=("programmatic_descriptions", "schema", "name")
+    )
     mock_metadata_processor.parse_programmatic_descriptions.assert_called_once_with(MOCK_TABLE_DATA)
     mock_metadata_processor.extract_table_schedule.assert_called_once_with(MOCK_PARSED_DESCRIPTIONS)
     assert result == "daily"
 
 
 @patch("mcp_amundsen.main.metadata_processor")
-@patch("mcp_amundsen.main.table_client")
-def test_get_table_storage_location(mock_table_client, mock_metadata_processor):
+@patch("mcp_amundsen.main.table_client", new_callable=AsyncMock)
+async def test_get_table_storage_location(mock_table_client, mock_metadata_processor):
     mock_table_client.get_metadata.return_value = MOCK_TABLE_DATA
     mock_metadata_processor.parse_programmatic_descriptions.return_value = MOCK_PARSED_DESCRIPTIONS
     mock_metadata_processor.extract_table_storage_location.return_value = "/path/to/storage"
-    result = get_table_storage_location("db", "schema", "table")
-    mock_table_client.get_metadata.assert_called_once_with("db", "schema", "table")
+    result = await get_table_storage_location("db", "schema", "table")
+    mock_table_client.get_metadata.assert_called_once_with(
+        "db", "schema", "table", fields=("programmatic_descriptions", "schema", "name")
+    )
     mock_metadata_processor.parse_programmatic_descriptions.assert_called_once_with(MOCK_TABLE_DATA)
     mock_metadata_processor.extract_table_storage_location.assert_called_once_with(MOCK_PARSED_DESCRIPTIONS)
     assert result == "/path/to/storage"
 
 
 @patch("mcp_amundsen.main.metadata_processor")
-@patch("mcp_amundsen.main.table_client")
-def test_get_table_owners(mock_table_client, mock_metadata_processor):
+@patch("mcp_amundsen.main.table_client", new_callable=AsyncMock)
+async def test_get_table_owners(mock_table_client, mock_metadata_processor):
     mock_table_client.get_metadata.return_value = MOCK_TABLE_DATA
     mock_metadata_processor.extract_owners.return_value = ["owner1"]
-    result = get_table_owners("db", "schema", "table")
-    mock_table_client.get_metadata.assert_called_once_with("db", "schema", "table")
+    result = await get_table_owners("db", "schema", "table")
+    mock_table_client.get_metadata.assert_called_once_with("db", "schema", "table", fields=("owners",))
     mock_metadata_processor.extract_owners.assert_called_once_with(MOCK_TABLE_DATA)
     assert result == ["owner1"]
 
 
-@patch("mcp_amundsen.main.table_client")
-def test_get_table_lineage_info(mock_table_client):
+@patch("mcp_amundsen.main.table_client", new_callable=AsyncMock)
+async def test_tool_maps_amundsen_error_to_error_dict(mock_table_client):
+    mock_table_client.get_metadata.side_effect = AmundsenApiError("HTTP Error: 500 Internal Server Error")
+    result = await get_table_columns("db", "schema", "table")
+    assert result == {"error": "API Error: HTTP Error: 500 Internal Server Error"}
+
+
+@patch("mcp_amundsen.main.metadata_processor")
+@patch("mcp_amundsen.main.table_client", new_callable=AsyncMock)
+async def test_get_tables_bulk(mock_table_client, mock_metadata_processor):
+    mock_table_client.get_metadata_bulk.return_value = [MOCK_TABLE_DATA, MOCK_TABLE_DATA]
+    mock_metadata_processor.extract_columns.return_value = {"columns": ["col1"], "partition_keys": []}
+    tables = [
+        {"database": "db", "schema_name": "schema", "table_name": "table1"},
+        {"database": "db", "schema_name": "schema", "table_name": "table2"},
+    ]
+    result = await get_tables_bulk(tables)
+    mock_table_client.get_metadata_bulk.assert_called_once_with(
+        [("db", "schema", "table1"), ("db", "schema", "table2")], fields=("columns",)
+    )
+    assert result[0]["table_name"] == "table1"
+    assert result[0]["columns"] == ["col1"]
+    assert result[1]["table_name"] == "table2"
+
+
+@patch("mcp_amundsen.main.metadata_processor")
+@patch("mcp_amundsen.main.table_client", new_callable=AsyncMock)
+async def test_get_tables_bulk_partial_failure(mock_table_client, mock_metadata_processor):
+    mock_table_client.get_metadata_bulk.return_value = [Exception("boom"), MOCK_TABLE_DATA]
+    mock_metadata_processor.extract_columns.return_value = {"columns": [], "partition_keys": []}
+    tables = [
+        {"database": "db", "schema_name": "schema", "table_name": "table1"},
+        {"database": "db", "schema_name": "schema", "table_name": "table2"},
+    ]
+    result = await get_tables_bulk(tables)
+    assert result[0]["error"] == "boom"
+    assert "error" not in result[1]
+
+
+@patch("mcp_amundsen.main.table_client", new_callable=AsyncMock)
+async def test_get_table_lineage_info(mock_table_client):
     mock_table_client.get_lineage.return_value = {"lineage": []}
-    result = get_table_lineage_info("db", "schema", "table")
+    result = await get_table_lineage_info("db", "schema", "table")
     mock_table_client.get_lineage.assert_called_once_with("db", "schema", "table", 10, "both")
-    assert result == {"lineage": []}
+    # With orjson installed the payload comes back pre-serialized as
+    # TextContent; without it the dict is returned for FastMCP to encode.
+    if orjson is None:
+        assert result == {"lineage": []}
+    else:
+        assert result.type == "text"
+        assert orjson.loads(result.text) == {"lineage": []}
+
+
+@patch("mcp_amundsen.main.table_client", new_callable=AsyncMock)
+async def test_get_table_lineage_info_call_tool(mock_table_client):
+    # Exercise the FastMCP layer: with structured_output=False the tool must
+    # ship a single text block holding the lineage JSON — identically with
+    # and without orjson — rather than a structuredContent envelope.
+    mock_table_client.get_lineage.return_value = {"lineage": []}
+    result = await mcp.call_tool(
+        "get_table_lineage_info", {"database": "db", "schema_name": "schema", "table_name": "table"}
+    )
+    [content] = result
+    assert content.type == "text"
+    assert json.loads(content.text) == {"lineage": []}
 
 
 @patch("mcp_amundsen.main.metadata_processor")
-@patch("mcp_amundsen.main.table_client")
-def test_get_table_dashboard_info(mock_table_client, mock_metadata_processor):
+@patch("mcp_amundsen.main.table_client", new_callable=AsyncMock)
+async def test_get_table_dashboard_info(mock_table_client, mock_metadata_processor):
     mock_table_client.get_dashboards.return_value = MOCK_DASHBOARD_DATA
     mock_metadata_processor.extract_dashboards.return_value = [{"name": "dash"}]
-    result = get_table_dashboard_info("db", "schema", "table")
+    result = await get_table_dashboard_info("db", "schema", "table")
     mock_table_client.get_dashboards.assert_called_once_with("db", "schema", "table")
     mock_metadata_processor.extract_dashboards.assert_called_once_with(MOCK_DASHBOARD_DATA)
     assert result == [{"name": "dash"}]
 
 
-@patch("mcp_amundsen.main.table_client")
-def test_get_table_dashboard_questions(mock_table_client):
+@patch("mcp_amundsen.main.table_client", new_callable=AsyncMock)
+async def test_get_table_dashboard_questions(mock_table_client):
     mock_table_client.questions.return_value = MOCK_QUESTIONS_DATA
-    result = get_table_dashboard_questions("db", "schema", "table", "dash")
+    result = await get_table_dashboard_questions("db", "schema", "table", "dash")
     mock_table_client.questions.assert_called_once_with("db", "schema", "table", "dash", 10)
     assert result == MOCK_QUESTIONS_DATA
 
 
-@patch("mcp_amundsen.main.table_client")
-def test_get_table_dashboard_question_query(mock_table_client):
+@patch("mcp_amundsen.main.table_client", new_callable=AsyncMock)
+async def test_get_table_dashboard_question_query(mock_table_client):
     mock_table_client.question_detail.return_value = MOCK_QUESTION_DETAIL
-    result = get_table_dashboard_question_query("db", "schema", "table", "dash", "question")
+    result = await get_table_dashboard_question_query("db", "schema", "table", "dash", "question")
     mock_table_client.question_detail.assert_called_once_with("db", "schema", "table", "dash", "question")
     assert result == {"result": {"query": "SELECT * FROM table"}}
 
 
 @patch("mcp_amundsen.main.search_processor")
-@patch("mcp_amundsen.main.search_client")
-def test_search_tables(mock_search_client, mock_search_processor):
+@patch("mcp_amundsen.main.search_client", new_callable=AsyncMock)
+async def test_search_tables(mock_search_client, mock_search_processor):
     mock_search_client.get_search_data.return_value = MOCK_SEARCH_DATA
     mock_search_processor.extract_search_data.return_value = {"tables": []}
-    result = search_tables("term")
+    result = await search_tables("term")
     mock_search_client.get_search_data.assert_called_once_with("term", ["hive"], [], [], [], "OR", [], {}, 10)
     mock_search_processor.extract_search_data.assert_called_once_with(MOCK_SEARCH_DATA)
     assert result == {"tables": []}
@@ -50,11 +50,6 @@ def test_extract_dashboards():
     assert len(result) == 2
     assert result[0]["dashboard_name"] == "Dashboard 1"
 
-def test_extract_columns_error():
-    processor = MetadataProcessor()
-    result = processor.extract_columns({"error": "Not found"})
-    assert result["error"] == "Not found"
-
 def test_extract_date_range_no_range():
     processor = MetadataProcessor()
     result = processor.extract_date_range({})
@@ -70,6 +65,11 @@ def test_extract_dashboards_no_dashboards():
     result = processor.extract_dashboards({"dashboards": []})
     assert result == []
 
+def test_extract_dashboards_missing_keys():
+    processor = MetadataProcessor()
+    result = processor.extract_dashboards({"dashboards": [{"name": "Dashboard 1"}]})
+    assert result == [{"url": None, "dashboard_name": "Dashboard 1", "collection_name": None}]
+
 # Mock data for search tests
 mock_search_data = [
     {